@@ -1,10 +1,16 @@
-from enum import Enum
-from typing import Optional, Callable, Dict, List, Union
+from enum import Enum, IntEnum
+from typing import Optional, Callable, Deque, Dict, List, Tuple, Union
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import itertools
 import time
 import random
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin
 
 class JobStatus(Enum):
@@ -35,17 +41,21 @@ class JobStatus(Enum):
     COMPLETED = "completed"
     ERROR = "error"
 
-class EventType(Enum):
-    JOB_CREATED = "job_created"
-    STATUS_CHANGED = "status_changed"
-    RETRY_ATTEMPTED = "retry_attempted"
-    ERROR_OCCURRED = "error_occurred"
-    JOB_COMPLETED = "job_completed"
-    JOB_FAILED = "job_failed"
-    TIMEOUT = "timeout"
-    CIRCUIT_BREAKER_OPENED = "circuit_breaker_opened"
-    CIRCUIT_BREAKER_CLOSED = "circuit_breaker_closed"
-    BATCH_OPERATION = "batch_operation"
+# Statuses that end a job's lifecycle; precomputed for membership checks.
+TERMINAL_STATUSES = frozenset({JobStatus.COMPLETED.value, JobStatus.ERROR.value})
+
+class EventType(IntEnum):
+    """Event types are small ordinals so listener lookup is a list index."""
+    JOB_CREATED = 0
+    STATUS_CHANGED = 1
+    RETRY_ATTEMPTED = 2
+    ERROR_OCCURRED = 3
+    JOB_COMPLETED = 4
+    JOB_FAILED = 5
+    TIMEOUT = 6
+    CIRCUIT_BREAKER_OPENED = 7
+    CIRCUIT_BREAKER_CLOSED = 8
+    BATCH_OPERATION = 9
 
 @dataclass
 class Event:
@@ -74,51 +84,93 @@ class PollingConfig:
         self.timeout = timeout
 
 class CircuitBreaker:
+    """Three-state breaker: closed -> open -> half_open -> closed/open.
+
+    After reset_timeout the breaker admits exactly one probe request
+    (half_open) instead of fully closing, so a still-down backend only
+    sees a single request before the circuit reopens.
+
+    Failures are counted with itertools.count: next() and attribute
+    rebinding are each a single bytecode under the GIL, so the breaker
+    stays correct when the session is shared across batch worker threads
+    without taking a lock per request.
+    """
+
     def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
         self.failure_threshold = failure_threshold
         self.reset_timeout = reset_timeout
-        self.failures = 0
+        self._failures = itertools.count(1)
+        # Admission gate for the half-open probe: only the caller that
+        # draws 0 gets through, so concurrent threads passing the elapsed
+        # check cannot each admit a probe. Re-armed whenever the breaker
+        # opens.
+        self._probe_gate = itertools.count()
         self.last_failure_time = None
-        self.is_open = False
+        self.state = "closed"
 
     def record_failure(self):
-        self.failures += 1
-        self.last_failure_time = time.time()
-        if self.failures >= self.failure_threshold:
-            self.is_open = True
+        failures = next(self._failures)
+        self.last_failure_time = time.monotonic()
+        if self.state == "half_open" or failures >= self.failure_threshold:
+            self._probe_gate = itertools.count()
+            self.state = "open"
 
     def record_success(self):
-        self.failures = 0
-        self.is_open = False
+        self._failures = itertools.count(1)
+        self.state = "closed"
 
     def can_execute(self) -> bool:
-        if not self.is_open:
+        if self.state == "closed":
             return True
-        
-        if time.time() - self.last_failure_time >= self.reset_timeout:
-            self.is_open = False
-            self.failures = 0
-            return True
-            
+
+        if self.state == "open":
+            if time.monotonic() - self.last_failure_time >= self.reset_timeout:
+                # Admit a single probe; its outcome decides the next state.
+                # Drawing from the gate is atomic under the GIL, so exactly
+                # one of any concurrent callers wins the probe slot.
+                if next(self._probe_gate) == 0:
+                    self.state = "half_open"
+                    return True
+                return False
+            return False
+
+        # half_open: a probe is already in flight
         return False
 
 class EventHandler:
-    def __init__(self):
-        self.listeners: Dict[EventType, List[Callable[[Event], None]]] = {
-            event_type: [] for event_type in EventType
-        }
-        self.history: List[Event] = []
-    
+    def __init__(self, history_size: int = 1024):
+        # Listener snapshots are immutable tuples rebuilt on (un)subscribe,
+        # so dispatch can iterate them without a defensive copy even if a
+        # callback mutates the subscription set mid-fire. The table is a
+        # flat list indexed by the EventType ordinal — cheaper than an
+        # enum-keyed dict lookup on the dispatch hot path.
+        self.listeners: List[Tuple[Callable[[Event], None], ...]] = [
+            () for _ in EventType
+        ]
+        # Bounded so long-running clients keep constant memory; old events
+        # fall off the front once history_size is reached.
+        self.history: Deque[Event] = deque(maxlen=history_size)
+
     def subscribe(self, event_type: EventType, callback: Callable[[Event], None]):
-        self.listeners[event_type].append(callback)
-    
+        self.listeners[event_type] = self.listeners[event_type] + (callback,)
+
     def unsubscribe(self, event_type: EventType, callback: Callable[[Event], None]):
-        if callback in self.listeners[event_type]:
-            self.listeners[event_type].remove(callback)
-    
+        self.listeners[event_type] = tuple(
+            cb for cb in self.listeners[event_type] if cb != callback
+        )
+
+    def has_listeners(self, event_type: EventType) -> bool:
+        """Cheap check for call sites that want to skip Event construction"""
+        return bool(self.listeners[event_type])
+
     def dispatch(self, event: Event):
         self.history.append(event)
-        for callback in self.listeners[event.type]:
+        listeners = self.listeners[event.type]
+        if not listeners:
+            # Fast path: nothing subscribed to this event type, so skip
+            # the iteration and try/except machinery entirely.
+            return
+        for callback in listeners:
             try:
                 callback(event)
             except Exception as e:
@@ -136,6 +188,33 @@ class TranslationClient:
         self.event_handler = EventHandler()
         self.circuit_breaker = CircuitBreaker()
         self.MAX_RETRIES = 3
+        self.MAX_BATCH_WORKERS = 16
+        # Assume the server supports ?wait= long-polling until a waited
+        # request comes back without the eta marker field, which means
+        # the server ignored the parameter.
+        self._supports_long_poll = True
+
+        # Endpoint URLs never change for a client, so build them once
+        # rather than paying for urljoin on every request.
+        self._job_url = urljoin(base_url, "job")
+        self._batch_status_url = urljoin(base_url, "status/batch")
+        self._status_prefix = base_url.rstrip("/") + "/status/"
+
+        # Tuned adapter: a pool large enough for batch workers plus many
+        # concurrent polls, and transport-level retries for 5xx/connection
+        # errors so the client code never has to re-issue requests itself.
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=self.MAX_RETRIES,
+                backoff_factor=self.polling_config.initial_interval,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=("GET", "POST")
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _add_jitter(self, interval: float) -> float:
         jitter = interval * self.polling_config.jitter_factor
@@ -148,16 +227,6 @@ class TranslationClient:
         )
         return self._add_jitter(next_interval)
 
-    def _should_retry(self, exception: Exception) -> bool:
-        if isinstance(exception, requests.exceptions.RequestException):
-            if isinstance(exception, requests.exceptions.HTTPError):
-                return 500 <= exception.response.status_code < 600
-            return isinstance(exception, (
-                requests.exceptions.ConnectionError,
-                requests.exceptions.Timeout
-            ))
-        return False
-
     def on(self, event_type: EventType, callback: Callable[[Event], None]):
         """Subscribe to an event"""
         self.event_handler.subscribe(event_type, callback)
@@ -171,220 +240,291 @@ class TranslationClient:
     def create_job(self) -> str:
         """Create a new translation job with circuit breaker and event handling"""
         if not self.circuit_breaker.can_execute():
-            self.event_handler.dispatch(Event(
-                type=EventType.CIRCUIT_BREAKER_OPENED,
-                job_id="",
-                timestamp=datetime.now(),
-                data={"message": "Circuit breaker is open"}
-            ))
+            if self.event_handler.has_listeners(EventType.CIRCUIT_BREAKER_OPENED):
+                self.event_handler.dispatch(Event(
+                    type=EventType.CIRCUIT_BREAKER_OPENED,
+                    job_id="",
+                    timestamp=datetime.now(),
+                    data={"message": "Circuit breaker is open"}
+                ))
             raise RuntimeError("Circuit breaker is open")
 
         try:
-            response = self.session.post(urljoin(self.base_url, "job"))
+            response = self.session.post(self._job_url)
             response.raise_for_status()
-            job_id = response.json()["job_id"]
-            
+            payload = orjson.loads(response.content)
+            job_id = payload["job_id"]
+
             self.circuit_breaker.record_success()
-            self.event_handler.dispatch(Event(
-                type=EventType.JOB_CREATED,
-                job_id=job_id,
-                timestamp=datetime.now(),
-                data={"response": response.json()}
-            ))
+            if self.event_handler.has_listeners(EventType.JOB_CREATED):
+                self.event_handler.dispatch(Event(
+                    type=EventType.JOB_CREATED,
+                    job_id=job_id,
+                    timestamp=datetime.now(),
+                    data={"response": payload}
+                ))
             
             return job_id
             
         except Exception as e:
             self.circuit_breaker.record_failure()
-            self.event_handler.dispatch(Event(
-                type=EventType.ERROR_OCCURRED,
-                job_id="",
-                timestamp=datetime.now(),
-                error=e,
-                data={"action": "create_job"}
-            ))
+            if self.event_handler.has_listeners(EventType.ERROR_OCCURRED):
+                self.event_handler.dispatch(Event(
+                    type=EventType.ERROR_OCCURRED,
+                    job_id="",
+                    timestamp=datetime.now(),
+                    error=e,
+                    data={"action": "create_job"}
+                ))
             raise
 
     def create_batch_jobs(self, count: int) -> List[str]:
-        """Create multiple jobs at once"""
+        """Create multiple jobs in parallel over the pooled session"""
         job_ids = []
         errors = []
 
-        for _ in range(count):
-            try:
-                job_id = self.create_job()
-                job_ids.append(job_id)
-            except Exception as e:
-                errors.append(str(e))
-
-        self.event_handler.dispatch(Event(
-            type=EventType.BATCH_OPERATION,
-            job_id=job_ids,
-            timestamp=datetime.now(),
-            data={
-                "operation": "create",
-                "success_count": len(job_ids),
-                "error_count": len(errors),
-                "errors": errors
-            }
-        ))
-
-        return job_ids
+        workers = max(1, min(count, self.MAX_BATCH_WORKERS))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.create_job) for _ in range(count)]
+            for future in as_completed(futures):
+                try:
+                    job_ids.append(future.result())
+                except Exception as e:
+                    errors.append(str(e))
 
-    def get_status(self, job_id: str) -> str:
-        """Get status with improved error handling and circuit breaker"""
-        if not self.circuit_breaker.can_execute():
+        if self.event_handler.has_listeners(EventType.BATCH_OPERATION):
             self.event_handler.dispatch(Event(
-                type=EventType.CIRCUIT_BREAKER_OPENED,
-                job_id=job_id,
+                type=EventType.BATCH_OPERATION,
+                job_id=job_ids,
                 timestamp=datetime.now(),
-                data={"message": "Circuit breaker is open"}
+                data={
+                    "operation": "create",
+                    "success_count": len(job_ids),
+                    "error_count": len(errors),
+                    "errors": errors
+                }
             ))
+
+        return job_ids
+
+    def get_status(self, job_id: str, wait: Optional[float] = None) -> str:
+        """Get status with improved error handling and circuit breaker
+
+        When `wait` is given, the server holds the request open up to that
+        many seconds and responds as soon as the job leaves PENDING.
+        """
+        return self._poll_status(job_id, wait)[0]
+
+    def _poll_status(
+        self,
+        job_id: str,
+        wait: Optional[float] = None
+    ) -> Tuple[str, Optional[float]]:
+        """Fetch (status, eta) for a job; eta is None if the server omits it"""
+        if not self.circuit_breaker.can_execute():
+            if self.event_handler.has_listeners(EventType.CIRCUIT_BREAKER_OPENED):
+                self.event_handler.dispatch(Event(
+                    type=EventType.CIRCUIT_BREAKER_OPENED,
+                    job_id=job_id,
+                    timestamp=datetime.now(),
+                    data={"message": "Circuit breaker is open"}
+                ))
             raise RuntimeError("Circuit breaker is open")
 
         try:
-            response = self.session.get(urljoin(self.base_url, f"status/{job_id}"))
-            
+            response = self.session.get(
+                self._status_prefix + job_id,
+                params={"wait": wait} if wait is not None else None
+            )
+
+            # Fast path: a 200 needs one integer compare — skip
+            # raise_for_status and its exception machinery entirely.
+            if response.status_code == 200:
+                self.circuit_breaker.record_success()
+                payload = orjson.loads(response.content)
+                eta = payload.get("eta")
+                if wait is not None and eta is None:
+                    # No marker field in the response: the server ignored
+                    # ?wait, so sleep client-side between polls instead of
+                    # re-polling it immediately.
+                    self._supports_long_poll = False
+                return payload["result"], eta
+
             try:
                 response.raise_for_status()
             except requests.exceptions.HTTPError as http_err:
-                self.event_handler.dispatch(Event(
-                    type=EventType.ERROR_OCCURRED,
-                    job_id=job_id,
-                    timestamp=datetime.now(),
-                    error=http_err,
-                    data={
-                        "status_code": response.status_code,
-                        "response_text": response.text
-                    }
-                ))
+                if self.event_handler.has_listeners(EventType.ERROR_OCCURRED):
+                    self.event_handler.dispatch(Event(
+                        type=EventType.ERROR_OCCURRED,
+                        job_id=job_id,
+                        timestamp=datetime.now(),
+                        error=http_err,
+                        data={
+                            "status_code": response.status_code,
+                            "response_text": response.text
+                        }
+                    ))
                 self.circuit_breaker.record_failure()
                 raise
 
             self.circuit_breaker.record_success()
-            return response.json()["result"]
-            
+            payload = orjson.loads(response.content)
+            return payload["result"], payload.get("eta")
+
         except requests.exceptions.RequestException as e:
-            self.event_handler.dispatch(Event(
-                type=EventType.ERROR_OCCURRED,
-                job_id=job_id,
-                timestamp=datetime.now(),
-                error=e,
-                data={"error_type": type(e).__name__}
-            ))
+            if self.event_handler.has_listeners(EventType.ERROR_OCCURRED):
+                self.event_handler.dispatch(Event(
+                    type=EventType.ERROR_OCCURRED,
+                    job_id=job_id,
+                    timestamp=datetime.now(),
+                    error=e,
+                    data={"error_type": type(e).__name__}
+                ))
             self.circuit_breaker.record_failure()
-            
-            if self._should_retry(e):
-                raise RetryableError("Retryable error occurred") from e
             raise
 
     def get_batch_status(self, job_ids: List[str]) -> Dict[str, str]:
-        """Get status for multiple jobs"""
+        """Get status for multiple jobs with a single batched request"""
+        return self._poll_batch_status(job_ids)[0]
+
+    def _poll_batch_status(
+        self,
+        job_ids: List[str]
+    ) -> Tuple[Dict[str, str], Optional[float]]:
+        """Fetch ({job_id: status}, eta) in one request
+
+        eta is the server-reported time until the next pending job is
+        due, or None when the server does not provide one.
+        """
         statuses = {}
         errors = []
+        eta = None
 
-        for job_id in job_ids:
-            try:
-                status = self.get_status(job_id)
-                statuses[job_id] = status
-            except Exception as e:
-                errors.append((job_id, str(e)))
-                statuses[job_id] = "error"
-
-        self.event_handler.dispatch(Event(
-            type=EventType.BATCH_OPERATION,
-            job_id=job_ids,
-            timestamp=datetime.now(),
-            data={
-                "operation": "status_check",
-                "statuses": statuses,
-                "error_count": len(errors),
-                "errors": errors
-            }
-        ))
-
-        return statuses
+        try:
+            response = self.session.post(
+                self._batch_status_url,
+                json={"job_ids": job_ids}
+            )
+            response.raise_for_status()
+            payload = orjson.loads(response.content)
+            if "statuses" in payload:
+                statuses = payload["statuses"]
+                eta = payload.get("eta")
+            else:
+                # Legacy flat {job_id: status} response
+                statuses = payload
+        except requests.exceptions.RequestException:
+            # Older servers without /status/batch: fall back to one GET per job
+            for job_id in job_ids:
+                try:
+                    status = self.get_status(job_id)
+                    statuses[job_id] = status
+                except Exception as e:
+                    errors.append((job_id, str(e)))
+                    statuses[job_id] = "error"
+
+        if self.event_handler.has_listeners(EventType.BATCH_OPERATION):
+            self.event_handler.dispatch(Event(
+                type=EventType.BATCH_OPERATION,
+                job_id=job_ids,
+                timestamp=datetime.now(),
+                data={
+                    "operation": "status_check",
+                    "statuses": statuses,
+                    "error_count": len(errors),
+                    "errors": errors
+                }
+            ))
+
+        return statuses, eta
 
     def wait_for_completion(
         self,
         job_id: str,
     ) -> str:
         """Wait for job completion with enhanced error handling and events"""
-        start_time = time.time()
+        start_time = time.monotonic()
         current_interval = self.polling_config.initial_interval
         last_status = None
-        retry_count = 0
+        attempt = 0
 
         while True:
-            if time.time() - start_time > self.polling_config.timeout:
-                self.event_handler.dispatch(Event(
-                    type=EventType.TIMEOUT,
-                    job_id=job_id,
-                    timestamp=datetime.now(),
-                    data={"elapsed_time": time.time() - start_time}
-                ))
-                raise TimeoutError(f"Job {job_id} did not complete within {self.polling_config.timeout} seconds")
-
-            try:
-                status = self.get_status(job_id)
-                
-                if status != last_status:
+            attempt += 1
+            if time.monotonic() - start_time > self.polling_config.timeout:
+                if self.event_handler.has_listeners(EventType.TIMEOUT):
                     self.event_handler.dispatch(Event(
-                        type=EventType.STATUS_CHANGED,
+                        type=EventType.TIMEOUT,
                         job_id=job_id,
                         timestamp=datetime.now(),
-                        previous_state=last_status,
-                        current_state=status,
-                        data={"attempt": retry_count + 1}
+                        data={"elapsed_time": time.monotonic() - start_time}
                     ))
+                raise TimeoutError(f"Job {job_id} did not complete within {self.polling_config.timeout} seconds")
+
+            try:
+                if self._supports_long_poll:
+                    remaining = self.polling_config.timeout - (time.monotonic() - start_time)
+                    status, eta = self._poll_status(
+                        job_id,
+                        wait=min(self.polling_config.max_interval, remaining)
+                    )
+                else:
+                    status, eta = self._poll_status(job_id)
+
+                if status != last_status:
+                    if self.event_handler.has_listeners(EventType.STATUS_CHANGED):
+                        self.event_handler.dispatch(Event(
+                            type=EventType.STATUS_CHANGED,
+                            job_id=job_id,
+                            timestamp=datetime.now(),
+                            previous_state=last_status,
+                            current_state=status,
+                            data={"attempt": attempt}
+                        ))
                     last_status = status
 
                 if status == JobStatus.ERROR.value:
-                    self.event_handler.dispatch(Event(
-                        type=EventType.JOB_FAILED,
-                        job_id=job_id,
-                        timestamp=datetime.now(),
-                        data={"final_status": status}
-                    ))
+                    if self.event_handler.has_listeners(EventType.JOB_FAILED):
+                        self.event_handler.dispatch(Event(
+                            type=EventType.JOB_FAILED,
+                            job_id=job_id,
+                            timestamp=datetime.now(),
+                            data={"final_status": status}
+                        ))
                     raise RuntimeError(f"Job {job_id} failed with error status")
                 
                 if status == JobStatus.COMPLETED.value:
-                    self.event_handler.dispatch(Event(
-                        type=EventType.JOB_COMPLETED,
-                        job_id=job_id,
-                        timestamp=datetime.now(),
-                        data={"final_status": status}
-                    ))
+                    if self.event_handler.has_listeners(EventType.JOB_COMPLETED):
+                        self.event_handler.dispatch(Event(
+                            type=EventType.JOB_COMPLETED,
+                            job_id=job_id,
+                            timestamp=datetime.now(),
+                            data={"final_status": status}
+                        ))
                     return status
 
-                current_interval = self._get_next_interval(current_interval)
-                time.sleep(current_interval)
+                # Long-polled requests already blocked server-side, so only
+                # sleep between polls on the plain-polling fallback. When
+                # the server reported an ETA, sleep until then (clamped to
+                # max_interval) instead of backing off blindly.
+                if not self._supports_long_poll:
+                    if eta is not None:
+                        current_interval = min(
+                            max(eta, 0.05),
+                            self.polling_config.max_interval
+                        )
+                    else:
+                        current_interval = self._get_next_interval(current_interval)
+                    time.sleep(current_interval)
 
-            except RetryableError as e:
-                retry_count += 1
-                if retry_count > self.MAX_RETRIES:
-                    raise RuntimeError(f"Max retries ({self.MAX_RETRIES}) exceeded") from e
-                
-                self.event_handler.dispatch(Event(
-                    type=EventType.RETRY_ATTEMPTED,
-                    job_id=job_id,
-                    timestamp=datetime.now(),
-                    error=e,
-                    retry_count=retry_count,
-                    data={"next_interval": current_interval}
-                ))
-                current_interval = self._get_next_interval(current_interval)
-                time.sleep(current_interval)
-                continue
-            
             except Exception as e:
-                self.event_handler.dispatch(Event(
-                    type=EventType.ERROR_OCCURRED,
-                    job_id=job_id,
-                    timestamp=datetime.now(),
-                    error=e,
-                    data={"action": "wait_for_completion"}
-                ))
+                if self.event_handler.has_listeners(EventType.ERROR_OCCURRED):
+                    self.event_handler.dispatch(Event(
+                        type=EventType.ERROR_OCCURRED,
+                        job_id=job_id,
+                        timestamp=datetime.now(),
+                        error=e,
+                        data={"action": "wait_for_completion"}
+                    ))
                 raise
 
     def wait_for_batch_completion(
@@ -393,33 +533,40 @@ class TranslationClient:
     ) -> Dict[str, str]:
         """Wait for multiple jobs to complete"""
         final_statuses = {}
-        start_time = time.time()
+        start_time = time.monotonic()
 
         while job_ids:
-            if time.time() - start_time > self.polling_config.timeout:
+            if time.monotonic() - start_time > self.polling_config.timeout:
                 remaining_jobs = [jid for jid in job_ids if jid not in final_statuses]
-                self.event_handler.dispatch(Event(
-                    type=EventType.TIMEOUT,
-                    job_id=remaining_jobs,
-                    timestamp=datetime.now(),
-                    data={
-                        "elapsed_time": time.time() - start_time,
-                        "completed_jobs": len(final_statuses),
-                        "remaining_jobs": len(remaining_jobs)
-                    }
-                ))
+                if self.event_handler.has_listeners(EventType.TIMEOUT):
+                    self.event_handler.dispatch(Event(
+                        type=EventType.TIMEOUT,
+                        job_id=remaining_jobs,
+                        timestamp=datetime.now(),
+                        data={
+                            "elapsed_time": time.monotonic() - start_time,
+                            "completed_jobs": len(final_statuses),
+                            "remaining_jobs": len(remaining_jobs)
+                        }
+                    ))
                 raise TimeoutError(f"Batch operation did not complete within {self.polling_config.timeout} seconds")
 
-            statuses = self.get_batch_status(job_ids)
-            
-            # Update completed/failed jobs
-            for job_id in list(job_ids):  # Create copy for safe modification
-                status = statuses.get(job_id)
-                if status in [JobStatus.COMPLETED.value, JobStatus.ERROR.value]:
-                    final_statuses[job_id] = status
-                    job_ids.remove(job_id)
+            statuses, eta = self._poll_batch_status(job_ids)
+
+            # Split finished jobs out in a single pass instead of O(N)
+            # list.remove calls per completion.
+            done = {jid for jid, status in statuses.items()
+                    if status in TERMINAL_STATUSES}
+            final_statuses.update({jid: statuses[jid] for jid in done})
+            job_ids = [jid for jid in job_ids if jid not in done]
 
             if job_ids:
-                time.sleep(self._get_next_interval(self.polling_config.initial_interval))
+                # Sleep until the next job is due when the server told us,
+                # otherwise fall back to the jittered interval.
+                if eta is not None:
+                    interval = min(max(eta, 0.05), self.polling_config.max_interval)
+                else:
+                    interval = self._get_next_interval(self.polling_config.initial_interval)
+                time.sleep(interval)
 
         return final_statuses
\ No newline at end of file
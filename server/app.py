@@ -1,9 +1,25 @@
+import re
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional
-from uuid import UUID, uuid4
-from flask import Flask, jsonify
+from typing import List, Optional
+import orjson
+from flask import Flask, Response, jsonify, request
+
+# Job IDs are base36-encoded table indexes; reject anything else early.
+JOB_ID_RE = re.compile(r'[0-9a-z]{1,13}')
+
+_BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+def _to_base36(n: int) -> str:
+    if n == 0:
+        return "0"
+    digits = []
+    while n:
+        n, r = divmod(n, 36)
+        digits.append(_BASE36_DIGITS[r])
+    return "".join(reversed(digits))
 
 class JobStatus(Enum):
     PENDING = "pending"
@@ -12,37 +28,74 @@ class JobStatus(Enum):
 
 @dataclass
 class Job:
-    id: UUID
+    id: str
     status: JobStatus
-    start_time: float
     process_time: float
+    deadline: float
+    done: threading.Event = field(default_factory=threading.Event)
 
 class JobManager:
+    # Upper bound on how long a single long-poll request may block.
+    MAX_LONG_POLL_WAIT = 30.0
+
     def __init__(self):
-        self.jobs: Dict[UUID, Job] = {}
-
-    def create_job(self, process_time: float = 10.0) -> UUID:
-        job_id = uuid4()
-        self.jobs[job_id] = Job(
-            id=job_id,
-            status=JobStatus.PENDING,
-            start_time=time.time(),
-            process_time=process_time
-        )
+        # Jobs live in a list indexed by their sequential ID, so the hot
+        # status lookup is an array index instead of a dict hash. The
+        # lock only guards ID allocation: reading len() and appending
+        # must be one atomic step or concurrent creates would hand the
+        # same slot to two jobs.
+        self.jobs: List[Job] = []
+        self._create_lock = threading.Lock()
+
+    def create_job(self, process_time: float = 10.0) -> str:
+        with self._create_lock:
+            job_id = _to_base36(len(self.jobs))
+            self.jobs.append(Job(
+                id=job_id,
+                status=JobStatus.PENDING,
+                process_time=process_time,
+                deadline=time.monotonic() + process_time
+            ))
         return job_id
 
-    def get_job_status(self, job_id: UUID) -> Optional[JobStatus]:
-        job = self.jobs.get(job_id)
-        if not job:
+    def get_job(self, job_id: str) -> Optional[Job]:
+        try:
+            idx = int(job_id, 36)
+        except (ValueError, TypeError):
+            # TypeError covers non-string IDs, e.g. numbers in a batch
+            # payload; treat them like any other unknown job.
+            return None
+        if 0 <= idx < len(self.jobs):
+            return self.jobs[idx]
+        return None
+
+    def get_job_status(self, job_id: str) -> Optional[JobStatus]:
+        job = self.get_job(job_id)
+        if job is None:
             return None
 
-        # Check if job should be completed based on elapsed time
-        elapsed_time = time.time() - job.start_time
-        if elapsed_time >= job.process_time and job.status == JobStatus.PENDING:
+        # Deadline is precomputed at creation, so the hot status path is a
+        # single clock read and compare for jobs still pending.
+        if job.status is JobStatus.PENDING and time.monotonic() >= job.deadline:
             job.status = JobStatus.COMPLETED
+            job.done.set()
 
         return job.status
 
+    def wait_for_status(self, job_id: str, wait: float) -> Optional[JobStatus]:
+        """Block up to `wait` seconds for the job to leave PENDING."""
+        status = self.get_job_status(job_id)
+        if status is not JobStatus.PENDING or wait <= 0:
+            return status
+
+        # The deadline tells us exactly when the job will flip, so never
+        # block past it (or past the long-poll cap).
+        job = self.get_job(job_id)
+        timeout = min(wait, self.MAX_LONG_POLL_WAIT,
+                      max(0.0, job.deadline - time.monotonic()))
+        job.done.wait(timeout)
+        return self.get_job_status(job_id)
+
 app = Flask(__name__)
 job_manager = JobManager()
 
@@ -50,22 +103,64 @@ job_manager = JobManager()
 def create_job():
     job_id = job_manager.create_job()
     return jsonify({
-        "job_id": str(job_id),
+        "job_id": job_id,
         "status": JobStatus.PENDING.value
     }), 201
 
 @app.route('/status/<job_id>', methods=['GET'])
 def get_status(job_id):
-    try:
-        job_id_uuid = UUID(job_id)
-    except ValueError:
+    if not JOB_ID_RE.fullmatch(job_id):
         return jsonify({"error": "Invalid job ID"}), 400
 
-    status = job_manager.get_job_status(job_id_uuid)
+    wait = request.args.get('wait', default=0.0, type=float)
+    if wait > 0:
+        status = job_manager.wait_for_status(job_id, wait)
+    else:
+        status = job_manager.get_job_status(job_id)
     if status is None:
         return jsonify({"error": "Job not found"}), 404
 
-    return jsonify({"result": status.value})
+    # Tell the client when the job is expected to finish so it can poll
+    # at the ETA instead of blindly backing off. orjson serializes the
+    # hot poll responses without going through jsonify.
+    job = job_manager.get_job(job_id)
+    return Response(orjson.dumps({
+        "result": status.value,
+        "eta": max(0.0, job.deadline - time.monotonic())
+    }), mimetype='application/json')
+
+@app.route('/status/batch', methods=['POST'])
+def get_batch_status():
+    payload = request.get_json(silent=True) or {}
+    job_ids = payload.get("job_ids")
+    if not isinstance(job_ids, list):
+        return jsonify({"error": "job_ids must be a list"}), 400
+
+    statuses = {}
+    pending_deadlines = []
+    for job_id in job_ids:
+        if not isinstance(job_id, str):
+            # Non-string entries can never name a job, and only string
+            # keys serialize into the response dict.
+            statuses[str(job_id)] = "error"
+            continue
+        status = job_manager.get_job_status(job_id)
+        if status is None:
+            statuses[job_id] = "error"
+            continue
+        statuses[job_id] = status.value
+        if status is JobStatus.PENDING:
+            pending_deadlines.append(job_manager.get_job(job_id).deadline)
+
+    # Seconds until the next pending job is due, so the client can sleep
+    # exactly that long before the next batch poll.
+    eta = (max(0.0, min(pending_deadlines) - time.monotonic())
+           if pending_deadlines else None)
+    return Response(orjson.dumps({
+        "statuses": statuses,
+        "eta": eta
+    }), mimetype='application/json')
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    from waitress import serve
+    serve(app, host='0.0.0.0', port=5000, threads=8)
\ No newline at end of file
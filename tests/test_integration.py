@@ -15,19 +15,44 @@ def format_time(timestamp):
 
 @pytest.fixture(scope="session")
 def server():
-    """Start the Flask server in a separate thread."""
+    """Start the app under waitress in a separate thread.
+
+    waitress runs a real worker pool, so concurrent batch polls execute
+    in parallel instead of serializing on Flask's dev server.
+    """
+    from waitress import serve
+
     app.config['TESTING'] = True
-    server_thread = threading.Thread(target=lambda: app.run(
+    server_thread = threading.Thread(target=lambda: serve(
+        app,
         host='localhost',
         port=5000,
-        debug=False,
-        use_reloader=False
+        threads=8
     ))
     server_thread.daemon = True
     server_thread.start()
     time.sleep(2)
     yield
 
+@pytest.fixture(scope="session")
+def client(server):
+    """One pooled client shared by every test.
+
+    Reusing a single TranslationClient keeps the underlying connection
+    pool warm across tests instead of paying a fresh TCP handshake storm
+    per test function.
+    """
+    return TranslationClient(
+        base_url="http://localhost:5000",
+        polling_config=PollingConfig(
+            initial_interval=0.5,
+            max_interval=2.0,
+            multiplier=2.0,
+            jitter_factor=0.1,
+            timeout=30.0
+        )
+    )
+
 class TestLogger:
     def __init__(self):
         self.events = []
@@ -48,23 +73,12 @@ class TestLogger:
             print(f"Data: {event.data}")
         print("-" * 40)
 
-def test_single_job_flow(server):
+def test_single_job_flow(client):
     """Test single job creation and monitoring"""
     print("\nTesting single job flow...")
-    
-    client = TranslationClient(
-        base_url="http://localhost:5000",
-        polling_config=PollingConfig(
-            initial_interval=0.5,
-            max_interval=2.0,
-            multiplier=1.5,
-            jitter_factor=0.1,
-            timeout=15.0
-        )
-    )
 
     logger = TestLogger()
-    
+
     # Subscribe to all events
     for event_type in EventType:
         client.on(event_type, logger.log_event)
@@ -85,19 +99,14 @@ def test_single_job_flow(server):
     except Exception as e:
         print(f"\nTest error: {str(e)}")
         raise
+    finally:
+        # The client is shared; detach this test's logger
+        for event_type in EventType:
+            client.off(event_type, logger.log_event)
 
-def test_batch_operations(server):
+def test_batch_operations(client):
     """Test batch job creation and monitoring"""
     print("\nTesting batch operations...")
-    
-    client = TranslationClient(
-        base_url="http://localhost:5000",
-        polling_config=PollingConfig(
-            initial_interval=0.5,
-            max_interval=2.0,
-            timeout=30.0
-        )
-    )
 
     logger = TestLogger()
     
@@ -122,19 +131,14 @@ def test_batch_operations(server):
     except Exception as e:
         print(f"\nTest error: {str(e)}")
         raise
+    finally:
+        client.off(EventType.BATCH_OPERATION, logger.log_event)
+        client.off(EventType.JOB_COMPLETED, logger.log_event)
+        client.off(EventType.ERROR_OCCURRED, logger.log_event)
 
-def test_error_handling_and_circuit_breaker(server):
+def test_error_handling_and_circuit_breaker(client):
     """Test error handling and circuit breaker functionality"""
     print("\nTesting error handling and circuit breaker...")
-    
-    client = TranslationClient(
-        base_url="http://localhost:5000",
-        polling_config=PollingConfig(
-            initial_interval=0.5,
-            max_interval=2.0,
-            timeout=15.0
-        )
-    )
 
     logger = TestLogger()
     
@@ -172,20 +176,16 @@ def test_error_handling_and_circuit_breaker(server):
     except Exception as e:
         print(f"\nUnexpected test error: {str(e)}")
         raise
-
-def test_polling_strategy(server):
+    finally:
+        client.off(EventType.ERROR_OCCURRED, logger.log_event)
+        client.off(EventType.CIRCUIT_BREAKER_OPENED, logger.log_event)
+        client.off(EventType.RETRY_ATTEMPTED, logger.log_event)
+        # Close the shared client's breaker so later tests start clean
+        client.circuit_breaker.record_success()
+
+def test_polling_strategy(client):
     """Test polling interval behavior"""
     print("\nTesting polling strategy...")
-    
-    client = TranslationClient(
-        base_url="http://localhost:5000",
-        polling_config=PollingConfig(
-            initial_interval=0.5,
-            max_interval=2.0,
-            multiplier=2.0,
-            timeout=15.0
-        )
-    )
 
     logger = TestLogger()
     client.on(EventType.STATUS_CHANGED, logger.log_event)
@@ -205,6 +205,8 @@ def test_polling_strategy(server):
     except Exception as e:
         print(f"\nTest error: {str(e)}")
         raise
+    finally:
+        client.off(EventType.STATUS_CHANGED, logger.log_event)
 
 if __name__ == "__main__":
     pytest.main([__file__, "-vv", "-s"])
\ No newline at end of file